@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from models import Product
 from decimal import Decimal
 import threading
@@ -40,6 +40,27 @@ class InMemoryDatabase:
                     return True
             return False
     
+    def patch_product(self, id: int, fields: Dict[str, Any]) -> bool:
+        with self._lock:
+            for product in self._products:
+                if product.id == id:
+                    for field, value in fields.items():
+                        setattr(product, field, value)
+                    return True
+            return False
+    
+    def patch_products(self, patches: List[Tuple[int, Dict[str, Any]]]) -> bool:
+        # All-or-nothing: nothing is applied if any of the ids is missing
+        with self._lock:
+            products_by_id = {product.id: product for product in self._products}
+            if any(id not in products_by_id for id, _ in patches):
+                return False
+            for id, fields in patches:
+                product = products_by_id[id]
+                for field, value in fields.items():
+                    setattr(product, field, value)
+            return True
+    
     def delete_product(self, id: int) -> bool:
         with self._lock:
             for i, product in enumerate(self._products):
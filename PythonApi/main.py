@@ -2,7 +2,7 @@ from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import Response, RedirectResponse
 from typing import List
-from models import Product, CreateProductCommand, UpdateProductCommand
+from models import Product, CreateProductCommand, UpdateProductCommand, PatchProductCommand, ProductPatch
 from database import db
 
 app = FastAPI(title="Product Inventory API", version="v1", docs_url="/swagger", redoc_url="/redoc")
@@ -45,6 +45,29 @@ async def update_product(id: int, command: UpdateProductCommand):
     return Response(status_code=200)
 
 
+@app.patch("/api/Products", tags=["Products"], operation_id="PatchProducts")
+async def patch_products(patches: List[ProductPatch]):
+    # Only the fields sent by the client are applied; omitted or null fields are left unchanged
+    success = db.patch_products([
+        (patch.id, patch.model_dump(exclude={"id"}, exclude_unset=True, exclude_none=True))
+        for patch in patches
+    ])
+    if not success:
+        raise HTTPException(status_code=404, detail="Product not found")
+    
+    return Response(status_code=200)
+
+
+@app.patch("/api/Products/{id}", tags=["Products"], operation_id="PatchProduct")
+async def patch_product(id: int, command: PatchProductCommand):
+    # Only the fields sent by the client are applied; omitted or null fields are left unchanged
+    success = db.patch_product(id, command.model_dump(exclude_unset=True, exclude_none=True))
+    if not success:
+        raise HTTPException(status_code=404, detail="Product not found")
+    
+    return Response(status_code=200)
+
+
 @app.delete("/api/Products/{id}", tags=["Products"], operation_id="DeleteProduct")
 async def delete_product(id: int):
     success = db.delete_product(id)
@@ -25,4 +25,16 @@ class UpdateProductCommand(BaseModel):
     sku: str
     stock: int
     price: Decimal
-    category: str
\ No newline at end of file
+    category: str
+
+
+class PatchProductCommand(BaseModel):
+    name: Optional[str] = None
+    sku: Optional[str] = None
+    stock: Optional[int] = None
+    price: Optional[Decimal] = None
+    category: Optional[str] = None
+
+
+class ProductPatch(PatchProductCommand):
+    id: int
@@ -320,4 +320,88 @@ class TestProductAPI:
         assert len(products) == len(special_names)
         
         for i, product in enumerate(products):
-            assert product["name"] == special_names[i]
\ No newline at end of file
+            assert product["name"] == special_names[i]
+    
+    def test_patch_product(self):
+        """Test partially updating a product with only the changed fields"""
+        product_id = self.client.post("/api/Products", json={
+            "name": "Original Product", "sku": "ORG-001", "stock": 5, "price": "19.99", "category": "Original Category"
+        }).json()
+        
+        response = self.client.patch(f"/api/Products/{product_id}", json={"price": "24.99"})
+        assert response.status_code == 200
+        
+        products = self.client.get("/api/Products").json()
+        assert products[0]["price"] == "24.99"
+        assert products[0]["name"] == "Original Product"
+        assert products[0]["sku"] == "ORG-001"
+        assert products[0]["stock"] == 5
+        assert products[0]["category"] == "Original Category"
+    
+    def test_patch_product_ignores_null_fields(self):
+        """Test that null fields in a partial update leave the product unchanged"""
+        product_id = self.client.post("/api/Products", json={
+            "name": "Original Product", "sku": "ORG-001", "stock": 5, "price": "19.99", "category": "Original Category"
+        }).json()
+        
+        response = self.client.patch(f"/api/Products/{product_id}", json={"name": None, "stock": 7})
+        assert response.status_code == 200
+        
+        products = self.client.get("/api/Products").json()
+        assert products[0]["name"] == "Original Product"
+        assert products[0]["stock"] == 7
+    
+    def test_patch_product_invalid_field(self):
+        """Test that only the sent fields are validated and bad values are rejected"""
+        product_id = self.client.post("/api/Products", json={
+            "name": "Original Product", "sku": "ORG-001", "stock": 5, "price": "19.99", "category": "Original Category"
+        }).json()
+        
+        response = self.client.patch(f"/api/Products/{product_id}", json={"price": "not-a-price"})
+        assert response.status_code == 422
+    
+    def test_patch_nonexistent_product(self):
+        """Test partially updating a product that doesn't exist"""
+        response = self.client.patch("/api/Products/999", json={"stock": 1})
+        assert response.status_code == 404
+        assert response.json()["detail"] == "Product not found"
+    
+    def test_patch_products(self):
+        """Test applying sparse updates to many products in one request"""
+        ids = []
+        for i in range(1, 4):
+            response = self.client.post("/api/Products", json={
+                "name": f"Product {i}", "sku": f"PRD-00{i}", "stock": i * 5, "price": f"{i * 10}.99", "category": f"Category {i}"
+            })
+            ids.append(response.json())
+        
+        response = self.client.patch("/api/Products", json=[
+            {"id": ids[0], "stock": 0},
+            {"id": ids[2], "category": "Clearance", "price": "9.99"}
+        ])
+        assert response.status_code == 200
+        
+        products = {p["id"]: p for p in self.client.get("/api/Products").json()}
+        assert products[ids[0]]["stock"] == 0
+        assert products[ids[0]]["name"] == "Product 1"
+        assert products[ids[1]]["stock"] == 10
+        assert products[ids[1]]["category"] == "Category 2"
+        assert products[ids[2]]["category"] == "Clearance"
+        assert products[ids[2]]["price"] == "9.99"
+        assert products[ids[2]]["stock"] == 15
+    
+    def test_patch_products_with_nonexistent_product(self):
+        """Test that a batch containing a missing product is rejected without applying any update"""
+        product_id = self.client.post("/api/Products", json={
+            "name": "Product 1", "sku": "PRD-001", "stock": 5, "price": "10.99", "category": "Category A"
+        }).json()
+        
+        response = self.client.patch("/api/Products", json=[
+            {"id": product_id, "stock": 99},
+            {"id": 999, "stock": 1}
+        ])
+        assert response.status_code == 404
+        assert response.json()["detail"] == "Product not found"
+        
+        products = self.client.get("/api/Products").json()
+        assert products[0]["stock"] == 5
\ No newline at end of file
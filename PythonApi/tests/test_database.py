@@ -180,4 +180,49 @@ class TestInMemoryDatabase:
         # Check that we have 30 products with unique IDs
         products = self.db.get_all_products()
         assert len(products) == 30
-        assert len(set(results)) == 30  # All IDs should be unique
\ No newline at end of file
+        assert len(set(results)) == 30  # All IDs should be unique
+    
+    def test_patch_product_updates_only_given_fields(self):
+        """Test that a partial update leaves omitted fields unchanged"""
+        product_id = self.db.create_product("Original Product", "ORG-001", 5, Decimal("19.99"), "Original Category")
+        
+        success = self.db.patch_product(product_id, {"stock": 42})
+        assert success == True
+        
+        product = self.db.get_product_by_id(product_id)
+        assert product.stock == 42
+        assert product.name == "Original Product"
+        assert product.sku == "ORG-001"
+        assert product.price == Decimal("19.99")
+        assert product.category == "Original Category"
+    
+    def test_patch_nonexistent_product(self):
+        """Test partially updating a product that doesn't exist"""
+        success = self.db.patch_product(999, {"stock": 1})
+        assert success == False
+    
+    def test_patch_multiple_products(self):
+        """Test applying sparse updates to several products at once"""
+        id1 = self.db.create_product("Product 1", "PRD-001", 5, Decimal("10.99"), "Category A")
+        id2 = self.db.create_product("Product 2", "PRD-002", 10, Decimal("20.99"), "Category B")
+        
+        success = self.db.patch_products([(id1, {"price": Decimal("11.99")}), (id2, {"name": "Renamed", "stock": 0})])
+        assert success == True
+        
+        product1 = self.db.get_product_by_id(id1)
+        assert product1.price == Decimal("11.99")
+        assert product1.name == "Product 1"
+        product2 = self.db.get_product_by_id(id2)
+        assert product2.name == "Renamed"
+        assert product2.stock == 0
+        assert product2.price == Decimal("20.99")
+    
+    def test_patch_multiple_products_is_atomic(self):
+        """Test that no updates are applied when any product in the batch is missing"""
+        id1 = self.db.create_product("Product 1", "PRD-001", 5, Decimal("10.99"), "Category A")
+        
+        success = self.db.patch_products([(id1, {"stock": 99}), (999, {"stock": 1})])
+        assert success == False
+        
+        product = self.db.get_product_by_id(id1)
+        assert product.stock == 5
\ No newline at end of file
@@ -8,6 +8,9 @@ const config: ConfigFile = {
     './src/store/api/generated/todos.ts': {
       filterEndpoints: [/Todo/]
     },
+    './src/store/api/generated/products.ts': {
+      filterEndpoints: [/Product/]
+    },
   },
   exportName: 'moviesApi',
   hooks: true,
@@ -11,9 +11,15 @@ export const productsEnhancedApi = productsApi.enhanceEndpoints({
         createProduct: {
             invalidatesTags: ['PRODUCT'],
         },
+        patchProducts: {
+            invalidatesTags: ['PRODUCT'],
+        },
         updateProduct: {
             invalidatesTags: ['PRODUCT'],
         },
+        patchProduct: {
+            invalidatesTags: ['PRODUCT'],
+        },
         deleteProduct: {
             invalidatesTags: ['PRODUCT'],
         },
@@ -23,6 +29,8 @@ export const productsEnhancedApi = productsApi.enhanceEndpoints({
 export const {
   useGetProductsQuery,
   useCreateProductMutation,
+  usePatchProductsMutation,
   useUpdateProductMutation,
+  usePatchProductMutation,
   useDeleteProductMutation,
 } = productsEnhancedApi;
\ No newline at end of file
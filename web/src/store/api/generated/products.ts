@@ -13,6 +13,13 @@ const injectedRtkApi = api.injectEndpoints({
         body: queryArg.createProductCommand,
       }),
     }),
+    patchProducts: build.mutation<PatchProductsApiResponse, PatchProductsApiArg>({
+      query: (queryArg) => ({
+        url: `/api/Products`,
+        method: "PATCH",
+        body: queryArg.body,
+      }),
+    }),
     updateProduct: build.mutation<UpdateProductApiResponse, UpdateProductApiArg>({
       query: (queryArg) => ({
         url: `/api/Products/${queryArg.id}`,
@@ -20,6 +27,13 @@ const injectedRtkApi = api.injectEndpoints({
         body: queryArg.updateProductCommand,
       }),
     }),
+    patchProduct: build.mutation<PatchProductApiResponse, PatchProductApiArg>({
+      query: (queryArg) => ({
+        url: `/api/Products/${queryArg.id}`,
+        method: "PATCH",
+        body: queryArg.patchProductCommand,
+      }),
+    }),
     deleteProduct: build.mutation<DeleteProductApiResponse, DeleteProductApiArg>({
       query: (queryArg) => ({
         url: `/api/Products/${queryArg.id}`,
@@ -38,11 +52,20 @@ export type CreateProductApiResponse =
 export type CreateProductApiArg = {
   createProductCommand: CreateProductCommand;
 };
+export type PatchProductsApiResponse = /** status 200 Successful Response */ any;
+export type PatchProductsApiArg = {
+  body: ProductPatch[];
+};
 export type UpdateProductApiResponse = /** status 200 Successful Response */ any;
 export type UpdateProductApiArg = {
   id: number;
   updateProductCommand: UpdateProductCommand;
 };
+export type PatchProductApiResponse = /** status 200 Successful Response */ any;
+export type PatchProductApiArg = {
+  id: number;
+  patchProductCommand: PatchProductCommand;
+};
 export type DeleteProductApiResponse = /** status 200 Successful Response */ any;
 export type DeleteProductApiArg = {
   id: number;
@@ -70,6 +93,14 @@ export type CreateProductCommand = {
   price: string;
   category: string;
 };
+export type ProductPatch = {
+  name?: string | null;
+  sku?: string | null;
+  stock?: number | null;
+  price?: string | null;
+  category?: string | null;
+  id: number;
+};
 export type UpdateProductCommand = {
   name: string;
   sku: string;
@@ -77,9 +108,18 @@ export type UpdateProductCommand = {
   price: string;
   category: string;
 };
+export type PatchProductCommand = {
+  name?: string | null;
+  sku?: string | null;
+  stock?: number | null;
+  price?: string | null;
+  category?: string | null;
+};
 export const {
   useGetProductsQuery,
   useCreateProductMutation,
+  usePatchProductsMutation,
   useUpdateProductMutation,
+  usePatchProductMutation,
   useDeleteProductMutation,
 } = injectedRtkApi;